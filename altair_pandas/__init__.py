@@ -1,6 +1,22 @@
 """Altair plotting extension for pandas."""
 __version__ = "0.1.0dev0"
-__all__ = ["plot", "hist_frame", "hist_series", "scatter_matrix"]
+__all__ = [
+    "plot",
+    "hist_frame",
+    "hist_series",
+    "scatter_matrix",
+    "Dashboard",
+    "StreamingChart",
+    "plot_spec",
+    "get_option",
+    "set_option",
+    "QuantileSketch",
+]
 
 from ._core import plot, hist_frame, hist_series
 from ._misc import scatter_matrix
+from ._dashboard import Dashboard
+from ._stream import StreamingChart
+from ._spec import plot_spec
+from ._config import get_option, set_option
+from ._quantile import QuantileSketch
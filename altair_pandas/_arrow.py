@@ -0,0 +1,77 @@
+"""Support for Arrow-backed input data.
+
+pyarrow is an optional dependency: it is only imported when the input data
+already consists of pyarrow objects or Arrow-backed pandas columns.
+"""
+import sys
+
+import pandas as pd
+
+
+def _pyarrow():
+    """Return the pyarrow module if it has already been imported, else None."""
+    return sys.modules.get("pyarrow")
+
+
+def _is_arrow_table(data):
+    pa = _pyarrow()
+    return pa is not None and isinstance(data, (pa.Table, pa.RecordBatch))
+
+
+def _is_arrow_array(data):
+    pa = _pyarrow()
+    return pa is not None and isinstance(data, (pa.Array, pa.ChunkedArray))
+
+
+def _is_arrow_dtype(dtype):
+    ArrowDtype = getattr(pd, "ArrowDtype", None)
+    return ArrowDtype is not None and isinstance(dtype, ArrowDtype)
+
+
+def _from_arrow(data):
+    """Wrap a pyarrow Table or Array in an Arrow-backed pandas object.
+
+    This does not copy or convert the underlying buffers: the result has
+    ``pd.ArrowDtype`` columns, which are converted with ``_to_native``
+    once the plotted columns have been selected.
+    """
+    if not hasattr(pd, "ArrowDtype"):
+        raise ImportError("Arrow input requires pandas>=1.5.")
+    if _is_arrow_table(data):
+        return data.to_pandas(types_mapper=pd.ArrowDtype)
+    return pd.Series(data.to_pandas(types_mapper=pd.ArrowDtype))
+
+
+def _native_type(arrow_type):
+    """types_mapper converting Arrow types to JSON-friendly pandas dtypes.
+
+    Arrow types not listed here use pyarrow's default conversion to NumPy,
+    which never produces object arrays for numeric or temporal data.
+    """
+    pa = _pyarrow()
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.StringDtype()
+    if pa.types.is_boolean(arrow_type):
+        return pd.BooleanDtype()
+    return None
+
+
+def _to_native(data):
+    """Convert Arrow-backed columns of a DataFrame to dtypes Altair can serialize.
+
+    Columns which are not Arrow-backed are returned untouched.
+
+    Examples
+    --------
+    >>> df = pd.DataFrame({"x": [1, 2]})
+    >>> _to_native(df) is df
+    True
+    """
+    columns = [col for col, dtype in data.dtypes.items() if _is_arrow_dtype(dtype)]
+    if not columns:
+        return data
+    data = data.copy(deep=False)
+    for col in columns:
+        chunks = data[col].array.__arrow_array__()
+        data[col] = chunks.to_pandas(types_mapper=_native_type).set_axis(data.index)
+    return data
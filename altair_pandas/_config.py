@@ -0,0 +1,37 @@
+"""Global options of altair_pandas."""
+
+_options = {
+    # Default number of threads for per-column work; -1 uses all CPUs.
+    "n_jobs": 1,
+}
+
+
+def get_option(name):
+    """Return the value of the option ``name``.
+
+    Examples
+    --------
+    >>> get_option("n_jobs")
+    1
+    """
+    if name not in _options:
+        raise KeyError(f"No option named {name!r}")
+    return _options[name]
+
+
+def set_option(name, value):
+    """Set the value of the option ``name``.
+
+    Parameters
+    ----------
+    name : str
+        The option to set. Available options are:
+
+        - ``"n_jobs"``: the number of threads used for per-column work
+          (cleaning, compaction and downsampling) by plot calls which do not
+          pass ``n_jobs``. ``-1`` uses all CPUs.
+    value
+        The new value of the option.
+    """
+    get_option(name)
+    _options[name] = value
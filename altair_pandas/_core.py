@@ -1,7 +1,16 @@
+import json
+from collections import namedtuple
+
 import altair as alt
 import pandas as pd
 import numpy as np
 
+from ._arrow import _from_arrow, _is_arrow_array, _is_arrow_table, _to_native
+from ._missing import _compact_columns, _drop_missing, _invalid_cells
+from ._quantile import DEFAULT_N_POINTS, _quantile_table
+from ._stream import StreamingChart
+from ._zoom import _downsample, _zoom_chart
+
 
 def _valid_column(column_name):
     """Return a valid column name."""
@@ -48,17 +57,110 @@ def _get_layout(panels, layout=None):
     return layout
 
 
+def _fold_columns(data, columns, id_vars=(), keep_gaps=False):
+    """Reshape columns into long form, as Vega-Lite's fold transform does.
+
+    The result has the ``id_vars`` columns, a ``"column"`` key and a
+    ``"value"`` column, with all the rows of the first folded column, then all
+    the rows of the second, and so on. Rather than repeating the column names
+    on every row, the key holds integer codes: the rank of each name in sorted
+    order, so that Vega-Lite orders (and colors) the keys as it would the
+    names. Use ``_fold_label_expr`` to label the codes with the names.
+
+    Parameters
+    ----------
+    data : DataFrame
+        The wide data.
+    columns : list of str
+        The columns to fold, which must be numeric.
+    id_vars : list of str
+        Columns repeated for every folded column.
+    keep_gaps : bool
+        Keep the first missing or infinite value (as NaN) of each run in a
+        column, so that lines are broken there. Otherwise, invalid values are
+        dropped.
+
+    Examples
+    --------
+    >>> data = pd.DataFrame({"x": [0, 1], "b": [1.0, None], "a": [3.0, 4.0]})
+    >>> _fold_columns(data, ["b", "a"], ["x"])
+       x  column  value
+    0  0       1    1.0
+    1  0       0    3.0
+    2  1       0    4.0
+    """
+    columns = list(columns)
+    non_numeric = [
+        col for col in columns if not pd.api.types.is_numeric_dtype(data[col])
+    ]
+    if non_numeric:
+        raise ValueError(f"Only numeric columns can be folded; got {non_numeric}")
+    invalid = _invalid_cells(data, columns)
+    keep = ~invalid
+    if keep_gaps:
+        keep[1:] |= invalid[1:] & ~invalid[:-1]
+    keep = keep.ravel(order="F")
+    values = data[columns].to_numpy(dtype=float, na_value=np.nan)
+    values = np.where(invalid, np.nan, values)
+
+    codes = np.argsort(np.argsort(columns, kind="stable"))
+    codes = codes.astype(np.min_scalar_type(max(len(columns) - 1, 0)))
+    rows = np.tile(np.arange(len(data)), len(columns))[keep]
+    long = data[list(id_vars)].iloc[rows].reset_index(drop=True)
+    long["column"] = np.repeat(codes, len(data))[keep]
+    long["value"] = values.ravel(order="F")[keep]
+    return long
+
+
+def _fold_label_expr(columns):
+    """Vega expression labelling the integer keys of ``_fold_columns``.
+
+    Examples
+    --------
+    >>> _fold_label_expr(["b", "a"])
+    '["a", "b"][datum.value]'
+    """
+    return json.dumps(sorted(columns)) + "[datum.value]"
+
+
+def _fold_channel(channel, columns, prefold, **kwargs):
+    """Encode the fold key ``"column"`` with ``channel``.
+
+    If the data was folded by ``_fold_columns``, the integer keys are labelled
+    with the column names in the channel's legend, header or axis.
+    """
+    if prefold:
+        guides = {alt.Color: ("legend", alt.Legend), alt.Facet: ("header", alt.Header)}
+        name, guide = guides.get(channel, ("axis", alt.Axis))
+        kwargs[name] = guide(labelExpr=_fold_label_expr(columns))
+    return channel("column:N", **kwargs)
+
+
+#: A chart whose construction was deferred; see ``_PandasPlotter._chart``.
+_Deferred = namedtuple("_Deferred", ["build", "data"])
+
+
 class _PandasPlotter:
     """Base class for pandas plotting."""
 
+    #: If True, plot methods return _Deferred instead of building charts.
+    _defer = False
+
+    #: Number of threads for per-column work; None uses the global option.
+    _n_jobs = None
+
     @classmethod
-    def create(cls, data):
+    def create(cls, data, n_jobs=None):
+        if _is_arrow_table(data) or _is_arrow_array(data):
+            data = _from_arrow(data)
         if isinstance(data, pd.Series):
-            return _SeriesPlotter(data)
+            plotter = _SeriesPlotter(data)
         elif isinstance(data, pd.DataFrame):
-            return _DataFramePlotter(data)
+            plotter = _DataFramePlotter(data)
         else:
             raise NotImplementedError(f"data of type {type(data)}")
+        plotter._n_jobs = n_jobs
+        return plotter
 
     def _get_mark_def(self, mark, kwargs):
         if isinstance(mark, str):
@@ -69,6 +171,111 @@ class _PandasPlotter:
             mark["color"] = kwargs.pop("color")
         return mark
 
+    def _cached(self, key, func, *args):
+        """Return ``func(*args)``, memoized under ``key`` for this plotter.
+
+        Plotters are created per plot call, except for dashboards, where
+        memoized tables are shared by all the panels of one frame.
+        """
+        if key not in self._cache:
+            self._cache[key] = func(*args)
+        return self._cache[key]
+
+    def _chart(self, build, data):
+        """Return ``build(data)``, the chart of a plot method.
+
+        Plot methods prepare the data to be plotted, and pass it here along
+        with the function building their chart from it. If ``_defer`` is set,
+        the chart is not built, so that the fast spec path can fill a cached
+        template with the data instead.
+        """
+        if self._defer:
+            return _Deferred(build, data)
+        return build(data)
+
+    def _interactive_chart(
+        self, build, data, x, columns, max_points=None, zoom=False, reshape=None
+    ):
+        """Chart with zoomable scales, possibly downsampled or re-aggregated on zoom.
+
+        ``x`` is the column shown on the zoomable axis, and ``columns`` are the
+        columns whose extremes are preserved when downsampling. If given,
+        ``reshape`` transforms the downsampled data into the data passed to
+        ``build``.
+        """
+        if zoom:
+
+            def rebuild(data):
+                return build(data if reshape is None else reshape(data))
+
+            return _zoom_chart(rebuild, data, x, columns, max_points, self._n_jobs)
+        data = _downsample(data, columns, max_points, self._n_jobs)
+        if reshape is not None:
+            data = reshape(data)
+        return self._chart(lambda data: build(data).interactive(), data)
+
+    def _cleaned_data(self, data, columns, usecols=None, how="all", keep_gaps=False):
+        """``_drop_missing`` applied to a preprocessed table, memoized.
+
+        Panels of a dashboard cleaning the same columns thus share a table.
+        Those cleaning different columns should pass ``usecols``, so that
+        they do not each embed a copy of all the columns.
+        """
+        usecols = None if usecols is None else tuple(usecols)
+        key = ("clean", id(data), tuple(columns), usecols, how, keep_gaps)
+        return self._cached(key, _drop_missing, data, columns, how, keep_gaps, usecols)
+
+    def _compacted_data(self, **kwargs):
+        """Preprocessed data without index, for plots aggregating each column."""
+        data = self._preprocess_data(with_index=False, **kwargs)
+        key = ("compact",) + tuple(data.columns)
+        return self._cached(key, _compact_columns, data, self._n_jobs)
+
+    def _distribution_chart(self, kind, data, n_points, method, color, kwargs):
+        """Chart of the ECDF or the quantile function of each column of data.
+
+        The quantiles are computed here, at a fixed number of probabilities
+        which are dense in the tails, so that the size of the chart does not
+        grow with the data.
+        """
+        key = ("quantile", tuple(data.columns), n_points, method)
+        table = self._cached(key, _quantile_table, data, n_points, method, self._n_jobs)
+        mark = self._get_mark_def("line", kwargs)
+        value = alt.X("value:Q", title=None)
+        probability = alt.Y("probability:Q", title="Probability")
+        tooltip = ["value:Q", alt.Tooltip("probability:Q", format=".4%")]
+        if color:
+            tooltip.insert(0, "column:N")
+
+        def build(table):
+            chart = alt.Chart(table, mark=mark).encode(
+                x=value, y=probability, tooltip=tooltip
+            )
+            if kind == "quantile":
+                chart.encoding.x, chart.encoding.y = chart.encoding.y, chart.encoding.x
+            if color:
+                chart = chart.encode(color=alt.Color("column:N", title=None))
+            return chart
+
+        return self._chart(build, table)
+
+    def _folded_data(self):
+        """Numeric data folded into long form, without its invalid cells."""
+        data = self._numeric_data()
+        key = ("fold",) + tuple(data.columns)
+        return self._cached(key, _fold_columns, data, list(data.columns), (), False)
+
+    def _aggregated_data(self, prefold):
+        """Data of plots aggregating each column, and the names of the columns.
+
+        Only numeric columns are folded in advance; otherwise, all the columns
+        are passed to Vega-Lite's fold transform.
+        """
+        if prefold:
+            return self._folded_data(), list(self._numeric_data().columns)
+        columns = list(self._preprocess_data(with_index=False).columns)
+        return self._compacted_data(), columns
+
 
 class _SeriesPlotter(_PandasPlotter):
     """Functionality for plotting of pandas Series."""
@@ -77,8 +284,12 @@ class _SeriesPlotter(_PandasPlotter):
         if not isinstance(data, pd.Series):
             raise ValueError(f"data: expected pd.Series; got {type(data)}")
         self._data = data
+        self._cache = {}
 
     def _preprocess_data(self, with_index=True):
+        return self._cached(("preprocess", with_index), self._preprocess, with_index)
+
+    def _preprocess(self, with_index):
         # TODO: do this without copy?
         data = self._data
         if with_index:
@@ -91,19 +302,30 @@ class _SeriesPlotter(_PandasPlotter):
         else:
             data = data.to_frame()
         # Column names must all be strings.
-        return data.rename(columns=_valid_column)
+        return _to_native(data.rename(columns=_valid_column))
 
-    def _xy(self, mark, **kwargs):
+    def _xy(
+        self, mark, max_points=None, zoom=False, stream=False, max_rows=None, **kwargs
+    ):
         data = self._preprocess_data(with_index=True)
-        return (
-            alt.Chart(data, mark=self._get_mark_def(mark, kwargs))
-            .encode(
-                x=alt.X(data.columns[0], title=None),
-                y=alt.Y(data.columns[1], title=None),
+        mark = self._get_mark_def(mark, kwargs)
+        x, y = data.columns
+        gaps = mark["type"] in ("line", "area")
+        data = self._cleaned_data(data, [y], keep_gaps=gaps)
+
+        def build(data):
+            chart = alt.Chart(data, mark=mark).encode(
+                x=alt.X(x, title=None),
+                y=alt.Y(y, title=None),
                 tooltip=list(data.columns),
             )
-            .interactive()
-        )
+            if mark.get("orient") == "horizontal":
+                chart.encoding.x, chart.encoding.y = chart.encoding.y, chart.encoding.x
+            return chart
+
+        if stream:
+            return StreamingChart(self, build, max_rows, [y], keep_gaps=gaps)
+        return self._interactive_chart(build, data, x, [y], max_points, zoom)
 
     def line(self, **kwargs):
         return self._xy("line", **kwargs)
@@ -112,9 +334,7 @@ class _SeriesPlotter(_PandasPlotter):
         return self._xy({"type": "bar", "orient": "vertical"}, **kwargs)
 
     def barh(self, **kwargs):
-        chart = self._xy({"type": "bar", "orient": "horizontal"}, **kwargs)
-        chart.encoding.x, chart.encoding.y = chart.encoding.y, chart.encoding.x
-        return chart
+        return self._xy({"type": "bar", "orient": "horizontal"}, **kwargs)
 
     def area(self, **kwargs):
         return self._xy(mark="area", **kwargs)
@@ -122,8 +342,23 @@ class _SeriesPlotter(_PandasPlotter):
     def scatter(self, **kwargs):
         raise ValueError("kind='scatter' can only be used for DataFrames.")
 
+    def _numeric_data(self):
+        if not pd.api.types.is_numeric_dtype(self._data):
+            raise ValueError(f"expected a numeric Series; got dtype {self._data.dtype}")
+        return self._preprocess_data(with_index=False)
+
+    def ecdf(self, n_points=DEFAULT_N_POINTS, method="auto", **kwargs):
+        data = self._numeric_data()
+        return self._distribution_chart("ecdf", data, n_points, method, False, kwargs)
+
+    def quantile(self, n_points=DEFAULT_N_POINTS, method="auto", **kwargs):
+        data = self._numeric_data()
+        return self._distribution_chart(
+            "quantile", data, n_points, method, False, kwargs
+        )
+
     def hist(self, bins=None, orientation="vertical", **kwargs):
-        data = self._preprocess_data(with_index=False)
+        data = self._compacted_data()
         column = data.columns[0]
         if isinstance(bins, int):
             bins = alt.Bin(maxbins=bins)
@@ -137,24 +372,32 @@ class _SeriesPlotter(_PandasPlotter):
             raise ValueError("orientation must be 'horizontal' or 'vertical'.")
 
         mark = self._get_mark_def({"type": "bar", "orient": orientation}, kwargs)
-        return alt.Chart(data, mark=mark).encode(
-            Indep(column, title=None, bin=bins), Dep("count()", title="Frequency")
-        )
+
+        def build(data):
+            return alt.Chart(data, mark=mark).encode(
+                Indep(column, title=None, bin=bins), Dep("count()", title="Frequency")
+            )
+
+        return self._chart(build, data)
 
     def hist_series(self, **kwargs):
         return self.hist(**kwargs)
 
-    def box(self, vert=True, **kwargs):
-        data = self._preprocess_data(with_index=False)
-        chart = (
-            alt.Chart(data)
-            .transform_fold(list(data.columns), as_=["column", "value"])
-            .mark_boxplot()
-            .encode(x=alt.X("column:N", title=None), y="value:Q")
-        )
-        if not vert:
-            chart.encoding.x, chart.encoding.y = chart.encoding.y, chart.encoding.x
-        return chart
+    def box(self, vert=True, prefold=False, **kwargs):
+        data, columns = self._aggregated_data(prefold)
+
+        def build(data):
+            chart = alt.Chart(data)
+            if not prefold:
+                chart = chart.transform_fold(columns, as_=["column", "value"])
+            chart = chart.mark_boxplot().encode(
+                x=_fold_channel(alt.X, columns, prefold, title=None), y="value:Q"
+            )
+            if not vert:
+                chart.encoding.x, chart.encoding.y = chart.encoding.y, chart.encoding.x
+            return chart
+
+        return self._chart(build, data)
 
 
 class _DataFramePlotter(_PandasPlotter):
@@ -164,8 +407,13 @@ class _DataFramePlotter(_PandasPlotter):
         if not isinstance(data, pd.DataFrame):
             raise ValueError(f"data: expected pd.DataFrame; got {type(data)}")
         self._data = data
+        self._cache = {}
 
     def _preprocess_data(self, with_index=True, usecols=None):
+        key = ("preprocess", with_index, None if usecols is None else tuple(usecols))
+        return self._cached(key, self._preprocess, with_index, usecols)
+
+    def _preprocess(self, with_index, usecols):
         data = self._data.rename(columns=_valid_column)
         if usecols is not None:
             data = data[usecols]
@@ -174,10 +422,25 @@ class _DataFramePlotter(_PandasPlotter):
                 data.index = pd.Index(
                     [str(i) for i in data.index], name=data.index.name
                 )
-            return data.reset_index()
-        return data
-
-    def _xy(self, mark, x=None, y=None, stacked=False, subplots=False, **kwargs):
+            data = data.reset_index()
+        return _to_native(data)
+
+    def _xy(
+        self,
+        mark,
+        x=None,
+        y=None,
+        stacked=False,
+        subplots=False,
+        max_points=None,
+        zoom=False,
+        stream=False,
+        max_rows=None,
+        prefold=False,
+        **kwargs,
+    ):
+        if stream and prefold:
+            raise ValueError("prefold=True is not supported with stream=True.")
         data = self._preprocess_data(with_index=True)
 
         if x is None:
@@ -188,30 +451,49 @@ class _DataFramePlotter(_PandasPlotter):
 
         if y is None:
             y_values = list(data.columns[1:])
+            if prefold:
+                numeric = set(data._get_numeric_data().columns)
+                y_values = [col for col in y_values if col in numeric]
         else:
             y = _valid_column(y)
             assert y in data.columns
             y_values = [y]
 
-        chart = (
-            alt.Chart(data, mark=self._get_mark_def(mark, kwargs))
-            .transform_fold(y_values, as_=["column", "value"])
-            .encode(
+        mark = self._get_mark_def(mark, kwargs)
+        gaps = mark["type"] in ("line", "area")
+        data = self._cleaned_data(data, y_values, [x], keep_gaps=gaps)
+
+        def build(data):
+            chart = alt.Chart(data, mark=mark)
+            if not prefold:
+                chart = chart.transform_fold(y_values, as_=["column", "value"])
+            chart = chart.encode(
                 x=x,
                 y=alt.Y("value:Q", title=None, stack=stacked),
-                color=alt.Color("column:N", title=None),
-                tooltip=[x] + y_values,
+                color=_fold_channel(alt.Color, y_values, prefold, title=None),
+                # Folded data no longer has a column per series.
+                tooltip=[x, "value:Q"] if prefold else [x] + y_values,
             )
-            .interactive()
-        )
+            if mark.get("orient") == "horizontal":
+                chart.encoding.x, chart.encoding.y = chart.encoding.y, chart.encoding.x
 
-        if subplots:
-            nrows, ncols = _get_layout(len(y_values), kwargs.get("layout", (-1, 1)))
-            chart = chart.encode(facet=alt.Facet("column:N", title=None)).properties(
-                columns=ncols
-            )
+            if subplots:
+                nrows, ncols = _get_layout(len(y_values), kwargs.get("layout", (-1, 1)))
+                chart = chart.encode(
+                    facet=_fold_channel(alt.Facet, y_values, prefold, title=None)
+                ).properties(columns=ncols)
+
+            return chart
+
+        if stream:
+            return StreamingChart(self, build, max_rows, y_values, keep_gaps=gaps)
 
-        return chart
+        def fold(data):
+            return _fold_columns(data, y_values, [x], gaps)
+
+        return self._interactive_chart(
+            build, data, x, y_values, max_points, zoom, fold if prefold else None
+        )
 
     def line(self, x=None, y=None, **kwargs):
         return self._xy("line", x, y, **kwargs)
@@ -225,11 +507,9 @@ class _DataFramePlotter(_PandasPlotter):
         return self._xy({"type": "bar", "orient": "vertical"}, x, y, **kwargs)
 
     def barh(self, x=None, y=None, **kwargs):
-        chart = self._xy({"type": "bar", "orient": "horizontal"}, x, y, **kwargs)
-        chart.encoding.x, chart.encoding.y = chart.encoding.y, chart.encoding.x
-        return chart
+        return self._xy({"type": "bar", "orient": "horizontal"}, x, y, **kwargs)
 
-    def scatter(self, x, y, c=None, s=None, **kwargs):
+    def scatter(self, x, y, c=None, s=None, max_points=None, zoom=False, **kwargs):
         if x is None or y is None:
             raise ValueError("kind='scatter' requires 'x' and 'y' arguments.")
         encodings = {"x": _valid_column(x), "y": _valid_column(y)}
@@ -239,12 +519,21 @@ class _DataFramePlotter(_PandasPlotter):
             encodings["size"] = _valid_column(s)
         columns = list(set(encodings.values()))
         data = self._preprocess_data(with_index=False, usecols=columns)
+        data = self._cleaned_data(data, [encodings["x"], encodings["y"]], how="any")
         encodings["tooltip"] = columns
         mark = self._get_mark_def("point", kwargs)
-        return alt.Chart(data, mark=mark).encode(**encodings).interactive()
 
-    def hist(self, bins=None, stacked=None, orientation="vertical", **kwargs):
-        data = self._preprocess_data(with_index=False)
+        def build(data):
+            return alt.Chart(data, mark=mark).encode(**encodings)
+
+        return self._interactive_chart(
+            build, data, encodings["x"], [encodings["y"]], max_points, zoom
+        )
+
+    def hist(
+        self, bins=None, stacked=None, orientation="vertical", prefold=False, **kwargs
+    ):
+        data, columns = self._aggregated_data(prefold)
         if isinstance(bins, int):
             bins = alt.Bin(maxbins=bins)
         elif bins is None:
@@ -257,56 +546,88 @@ class _DataFramePlotter(_PandasPlotter):
             raise ValueError("orientation must be 'horizontal' or 'vertical'.")
 
         mark = self._get_mark_def({"type": "bar", "orient": orientation}, kwargs)
-        chart = (
-            alt.Chart(data, mark=mark)
-            .transform_fold(list(data.columns), as_=["column", "value"])
-            .encode(
+
+        def build(data):
+            chart = alt.Chart(data, mark=mark)
+            if not prefold:
+                chart = chart.transform_fold(columns, as_=["column", "value"])
+            chart = chart.encode(
                 Indep("value:Q", title=None, bin=bins),
                 Dep("count()", title="Frequency", stack=stacked),
-                color="column:N",
+                color=_fold_channel(alt.Color, columns, prefold),
             )
-        )
 
-        if kwargs.get("subplots"):
-            nrows, ncols = _get_layout(data.shape[1], kwargs.get("layout", (-1, 1)))
-            chart = chart.encode(facet=alt.Facet("column:N", title=None)).properties(
-                columns=ncols
-            )
+            if kwargs.get("subplots"):
+                nrows, ncols = _get_layout(len(columns), kwargs.get("layout", (-1, 1)))
+                chart = chart.encode(
+                    facet=_fold_channel(alt.Facet, columns, prefold, title=None)
+                ).properties(columns=ncols)
+
+            return chart
 
-        return chart
+        return self._chart(build, data)
+
+    def _numeric_data(self):
+        data = self._preprocess_data(with_index=False)
+        numeric = list(data._get_numeric_data().columns)
+        return self._preprocess_data(with_index=False, usecols=numeric)
+
+    def ecdf(self, n_points=DEFAULT_N_POINTS, method="auto", **kwargs):
+        data = self._numeric_data()
+        return self._distribution_chart("ecdf", data, n_points, method, True, kwargs)
+
+    def quantile(self, n_points=DEFAULT_N_POINTS, method="auto", **kwargs):
+        data = self._numeric_data()
+        return self._distribution_chart(
+            "quantile", data, n_points, method, True, kwargs
+        )
 
     def hist_frame(self, column=None, layout=(-1, 2), **kwargs):
         if column is not None:
             if isinstance(column, str):
                 column = [column]
         data = self._preprocess_data(with_index=False, usecols=column)
-        data = data._get_numeric_data()
+        numeric = list(data._get_numeric_data().columns)
+        data = self._compacted_data(usecols=numeric)
         nrows, ncols = _get_layout(data.shape[1], layout)
-        return (
-            alt.Chart(data, mark=self._get_mark_def("bar", kwargs))
-            .encode(
-                x=alt.X(alt.repeat("repeat"), type="quantitative", bin=True),
-                y=alt.Y("count()", title="Frequency"),
+        mark = self._get_mark_def("bar", kwargs)
+
+        def build(data):
+            return (
+                alt.Chart(data, mark=mark)
+                .encode(
+                    x=alt.X(alt.repeat("repeat"), type="quantitative", bin=True),
+                    y=alt.Y("count()", title="Frequency"),
+                )
+                .repeat(repeat=list(data.columns), columns=ncols)
             )
-            .repeat(repeat=list(data.columns), columns=ncols)
-        )
 
-    def box(self, vert=True, **kwargs):
-        data = self._preprocess_data(with_index=False)
-        chart = (
-            alt.Chart(data)
-            .transform_fold(list(data.columns), as_=["column", "value"])
-            .mark_boxplot()
-            .encode(x=alt.X("column:N", title=None), y="value:Q")
-        )
-        if not vert:
-            chart.encoding.x, chart.encoding.y = chart.encoding.y, chart.encoding.x
-        return chart
+        return self._chart(build, data)
+
+    def box(self, vert=True, prefold=False, **kwargs):
+        data, columns = self._aggregated_data(prefold)
+
+        def build(data):
+            chart = alt.Chart(data)
+            if not prefold:
+                chart = chart.transform_fold(columns, as_=["column", "value"])
+            chart = chart.mark_boxplot().encode(
+                x=_fold_channel(alt.X, columns, prefold, title=None), y="value:Q"
+            )
+            if not vert:
+                chart.encoding.x, chart.encoding.y = chart.encoding.y, chart.encoding.x
+            return chart
+
+        return self._chart(build, data)
 
 
-def plot(data, kind="line", **kwargs):
-    """Pandas plotting interface for Altair."""
-    plotter = _PandasPlotter.create(data)
+def plot(data, kind="line", n_jobs=None, **kwargs):
+    """Pandas plotting interface for Altair.
+
+    ``n_jobs`` is the number of threads used for per-column work on wide
+    frames; it defaults to ``get_option("n_jobs")``.
+    """
+    plotter = _PandasPlotter.create(data, n_jobs)
 
     if hasattr(plotter, kind):
         plotfunc = getattr(plotter, kind)
@@ -316,9 +637,9 @@ def plot(data, kind="line", **kwargs):
     return plotfunc(**kwargs)
 
 
-def hist_frame(data, **kwargs):
-    return _PandasPlotter.create(data).hist_frame(**kwargs)
+def hist_frame(data, n_jobs=None, **kwargs):
+    return _PandasPlotter.create(data, n_jobs).hist_frame(**kwargs)
 
 
-def hist_series(data, **kwargs):
-    return _PandasPlotter.create(data).hist_series(**kwargs)
+def hist_series(data, n_jobs=None, **kwargs):
+    return _PandasPlotter.create(data, n_jobs).hist_series(**kwargs)
@@ -0,0 +1,136 @@
+"""Dashboards of many plots of a single DataFrame."""
+from collections import Counter
+
+import altair as alt
+import pandas as pd
+
+from ._core import _PandasPlotter
+from ._misc import scatter_matrix
+
+
+def _subcharts(chart):
+    """Yield ``chart`` and all the charts nested within it."""
+    yield chart
+    for attr in ("spec", "layer", "hconcat", "vconcat", "concat"):
+        sub = getattr(chart, attr, alt.Undefined)
+        for subchart in sub if isinstance(sub, list) else [sub]:
+            if isinstance(subchart, alt.TopLevelMixin):
+                yield from _subcharts(subchart)
+
+
+def _chart_tables(chart):
+    """The DataFrames used as data by ``chart`` and its subcharts."""
+    data = (getattr(sub, "data", alt.Undefined) for sub in _subcharts(chart))
+    return [table for table in data if isinstance(table, pd.DataFrame)]
+
+
+def _detach_data(chart, is_shared):
+    """Remove the data of ``chart`` and its subcharts for which ``is_shared``.
+
+    Subcharts without data inherit the dataset of the enclosing compound chart.
+    """
+    for sub in _subcharts(chart):
+        if is_shared(getattr(sub, "data", alt.Undefined)):
+            sub.data = alt.Undefined
+    return chart
+
+
+class Dashboard:
+    """Build a compound chart of many plots of one DataFrame.
+
+    The frame is preprocessed once, and tables derived from it are memoized
+    across panels. The resulting chart embeds the table used by the most
+    panels (usually the frame itself) once, as a dataset inherited by these
+    panels, so its size does not grow with the number of panels. The frame
+    should not be modified while the dashboard is being built.
+
+    Parameters
+    ----------
+    data : DataFrame
+        The data to plot.
+    columns : int
+        Number of panels per row.
+    n_jobs : int, optional
+        Number of threads for per-column work; see ``set_option``.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({"x": range(5), "y": range(5)})
+    >>> chart = Dashboard(df).plot("line").plot("hist", bins=5).to_chart()
+    >>> len(chart.to_dict()["datasets"])
+    1
+    """
+
+    def __init__(self, data, columns=2, n_jobs=None):
+        self._plotter = _PandasPlotter.create(data, n_jobs)
+        self._columns = columns
+        self._panels = []
+
+    def _is_frame(self, data):
+        """Whether ``data`` holds the rows of the preprocessed frame.
+
+        This is the case for all its variants (with or without index, or a
+        subset of its columns), which can all inherit the frame with index.
+        """
+        return any(
+            data is table
+            for key, table in self._plotter._cache.items()
+            if key[0] == "preprocess"
+        )
+
+    def _table_key(self, data):
+        """Key identifying the tables which can share one dataset."""
+        return "frame" if self._is_frame(data) else id(data)
+
+    def plot(self, kind="line", **kwargs):
+        """Add a panel, as ``data.plot(kind=kind, **kwargs)`` would draw it."""
+        if not hasattr(self._plotter, kind):
+            raise NotImplementedError(f"kind='{kind}' for dashboards")
+        for option in ("stream", "zoom"):
+            if kwargs.get(option):
+                raise ValueError(f"{option}=True is not supported in dashboards.")
+        self._panels.append(getattr(self._plotter, kind)(**kwargs))
+        return self
+
+    def hist_frame(self, **kwargs):
+        """Add a panel, as ``data.hist(**kwargs)`` would draw it."""
+        return self.plot("hist_frame", **kwargs)
+
+    def scatter_matrix(self, **kwargs):
+        """Add a panel, as ``scatter_matrix(data, **kwargs)`` would draw it."""
+        data = self._plotter._preprocess_data(with_index=False)
+        chart = scatter_matrix(data, **kwargs)
+        # scatter_matrix copies its input, but keeps the rows of the frame.
+        for sub in _subcharts(chart):
+            if isinstance(getattr(sub, "data", alt.Undefined), pd.DataFrame):
+                sub.data = data
+        self._panels.append(chart)
+        return self
+
+    def to_chart(self):
+        """Concatenate the panels into a chart with a single shared dataset.
+
+        The shared dataset is the table used by the most panels, preferably the
+        preprocessed frame; panels plotting other tables keep their own data.
+        If no panel uses a DataFrame, the chart has no top-level data.
+        """
+        panels = [panel.copy(deep=True) for panel in self._panels]
+        uses = Counter(
+            key
+            for panel in panels
+            for key in {self._table_key(table) for table in _chart_tables(panel)}
+        )
+        if not uses:
+            return alt.concat(*panels, columns=self._columns)
+        shared = max(uses, key=lambda key: (uses[key], key == "frame"))
+        if shared == "frame":
+            data = self._plotter._preprocess_data(with_index=True)
+        else:
+            tables = (table for panel in panels for table in _chart_tables(panel))
+            data = next(table for table in tables if id(table) == shared)
+        panels = [
+            _detach_data(panel, lambda table: self._table_key(table) == shared)
+            for panel in panels
+        ]
+        return alt.concat(*panels, columns=self._columns, data=data)
@@ -2,10 +2,14 @@ import altair as alt
 from typing import Union, List
 import pandas as pd
 
+from ._arrow import _from_arrow, _is_arrow_table, _to_native
+
 tooltipList = List[alt.Tooltip]
 
 
 def _preprocess_data(data):
+    if _is_arrow_table(data):
+        data = _from_arrow(data)
     for indx in ("index", "columns"):
         if isinstance(getattr(data, indx), pd.MultiIndex):
             setattr(
@@ -16,7 +20,7 @@ def _preprocess_data(data):
                 ),
             )
     # Column names must all be strings.
-    return data.rename(columns=str).copy()
+    return _to_native(data.rename(columns=str).copy())
 
 
 def _process_tooltip(tooltip):
@@ -0,0 +1,125 @@
+"""Vectorized handling of missing and infinite values."""
+import numpy as np
+import pandas as pd
+
+from ._parallel import _column_blocks, _map_columns
+
+
+def _numpy_kind(dtype):
+    """The kind of a NumPy dtype ("f" for floats...), or None for extension types."""
+    return dtype.kind if isinstance(dtype, np.dtype) else None
+
+
+def _invalid_cells(data, columns):
+    """Return a boolean array flagging the missing or infinite cells of columns."""
+    data = data[list(columns)]
+    floats = [i for i, dtype in enumerate(data.dtypes) if _numpy_kind(dtype) == "f"]
+    if len(floats) == data.shape[1]:
+        return ~np.isfinite(data.to_numpy())
+    invalid = data.isna().to_numpy(copy=True)
+    if floats:
+        invalid[:, floats] |= np.isinf(data.iloc[:, floats].to_numpy())
+    return invalid
+
+
+def _drop_missing(
+    data, columns, how="all", keep_gaps=False, usecols=None, after_gap=True
+):
+    """Drop rows whose values in columns are missing or infinite.
+
+    Infinite values in the remaining rows are replaced by NaN.
+
+    Parameters
+    ----------
+    data : DataFrame
+        The data to clean. It is returned as is if it has no invalid cells.
+    columns : list of str
+        The columns to check.
+    how : {'all', 'any'}
+        Drop rows where all (or any) of the columns are invalid.
+    keep_gaps : bool
+        Keep the first row of each run of dropped rows, so that lines are
+        broken there, as pandas does for missing values.
+    usecols : list of str, optional
+        Other columns to keep, along with ``columns``, if rows are dropped.
+        By default, all the columns are kept.
+    after_gap : bool
+        Whether the rows of data follow an invalid row. If not, as for rows
+        appended after a valid row, the first row of a leading run of invalid
+        rows is also kept with ``keep_gaps``.
+
+    Examples
+    --------
+    >>> data = pd.DataFrame({"x": [1.0, None, None, np.inf, 5.0]})
+    >>> _drop_missing(data, ["x"])["x"].tolist()
+    [1.0, 5.0]
+    >>> _drop_missing(data, ["x"], keep_gaps=True)["x"].tolist()
+    [1.0, nan, 5.0]
+    >>> data["y"] = 0
+    >>> list(_drop_missing(data, ["x"], usecols=[]).columns)
+    ['x']
+    """
+    invalid = _invalid_cells(data, columns)
+    if not invalid.any():
+        return data
+    drop = invalid.all(axis=1) if how == "all" else invalid.any(axis=1)
+    if keep_gaps:
+        drop[1:] &= drop[:-1]
+        drop[0] &= after_gap
+    if usecols is not None:
+        keep = set(usecols).union(columns)
+        data = data[[col for col in data.columns if col in keep]]
+    data = data[~drop].copy()
+    # Only float columns can hold infinite values; mask those which do.
+    floats = [col for col in columns if _numpy_kind(data[col].dtype) == "f"]
+    values = data[floats].to_numpy()
+    infinite = np.isinf(values)
+    if infinite.any():
+        data.loc[:, floats] = np.where(infinite, np.nan, values)
+    return data
+
+
+def _compact_columns(data, n_jobs=None):
+    """Remove the missing or infinite cells of each column independently.
+
+    The valid values of every column are moved to the top, and shorter
+    columns are padded with NaN. Row alignment is lost, so this is only
+    suitable for data which is aggregated per column. Numeric frames are
+    compacted as a single array, whose column blocks are sorted by ``n_jobs``
+    threads.
+
+    Examples
+    --------
+    >>> data = pd.DataFrame({"x": [1.0, None, 3.0], "y": [None, None, 2.0]})
+    >>> _compact_columns(data).to_dict("list")
+    {'x': [1.0, 3.0], 'y': [2.0, nan]}
+    """
+    columns = list(data.columns)
+    invalid = _invalid_cells(data, columns)
+    if not invalid.any():
+        return data
+    if not all(_numpy_kind(dtype) in ("i", "u", "f") for dtype in data.dtypes):
+        return pd.concat(
+            [
+                data.iloc[:, i][~invalid[:, i]].reset_index(drop=True)
+                for i in range(len(columns))
+            ],
+            axis=1,
+        )
+
+    values = data.to_numpy(dtype=float)
+    counts = len(data) - invalid.sum(axis=0)
+    length = counts.max()
+
+    def compact(block):
+        # A stable sort of the mask moves the valid cells up, in order.
+        order = np.argsort(invalid[:, block], axis=0, kind="stable")[:length]
+        return np.take_along_axis(values[:, block], order, axis=0)
+
+    blocks = _column_blocks(len(columns), n_jobs)
+    values = np.concatenate(_map_columns(compact, blocks, n_jobs), axis=1)
+    values[np.arange(length)[:, None] >= counts] = np.nan
+    compacted = pd.DataFrame(values, columns=data.columns)
+    # Columns without invalid cells keep their type.
+    full = data.dtypes[counts == len(data)]
+    return compacted.astype(full.to_dict()) if len(full) else compacted
@@ -0,0 +1,54 @@
+"""Parallel per-column computations."""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from ._config import get_option
+
+
+def _n_jobs(n_jobs=None):
+    """Resolve n_jobs: None uses the global option, and negative values count
+    back from the number of CPUs, so that -1 uses all of them.
+
+    Examples
+    --------
+    >>> _n_jobs(3)
+    3
+    >>> _n_jobs(-1) == os.cpu_count()
+    True
+    """
+    if n_jobs is None:
+        n_jobs = get_option("n_jobs")
+    if n_jobs < 0:
+        n_jobs = max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def _map_columns(func, columns, n_jobs=None):
+    """Return ``[func(column) for column in columns]``, computed in parallel.
+
+    The work is split across a pool of ``n_jobs`` threads. This pays off for
+    NumPy-heavy ``func`` (sorting, masking, quantiles), which releases the GIL.
+
+    Examples
+    --------
+    >>> _map_columns(len, ["a", "bb", "ccc"], n_jobs=2)
+    [1, 2, 3]
+    """
+    n_jobs = min(_n_jobs(n_jobs), len(columns))
+    if n_jobs <= 1:
+        return [func(column) for column in columns]
+    with ThreadPoolExecutor(n_jobs) as pool:
+        return list(pool.map(func, columns))
+
+
+def _column_blocks(n_columns, n_jobs=None):
+    """Split ``range(n_columns)`` into one contiguous slice per job.
+
+    Examples
+    --------
+    >>> _column_blocks(5, n_jobs=2)
+    [slice(0, 2, None), slice(2, 5, None)]
+    """
+    n_blocks = max(min(_n_jobs(n_jobs), n_columns), 1)
+    bounds = [i * n_columns // n_blocks for i in range(n_blocks + 1)]
+    return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
@@ -0,0 +1,270 @@
+"""Quantiles of columns, by exact sorting or with a mergeable sketch."""
+import numpy as np
+import pandas as pd
+
+from ._parallel import _map_columns
+
+#: Default number of points evaluated per column by the ecdf and quantile kinds.
+DEFAULT_N_POINTS = 200
+
+# With method="auto", columns with more values than this use a sketch.
+_EXACT_MAX_VALUES = 1_000_000
+
+# Number of values added to a sketch at once.
+_CHUNK_SIZE = 1 << 20
+
+
+def _probabilities(n_points, n_values):
+    """Probabilities at which to evaluate the quantiles of ``n_values`` values.
+
+    The points are evenly spaced in logit space, so that they are dense in
+    both tails, down to a tail probability of ``1 / n_values`` (at most 1e-6),
+    beyond which the data carries no information. The extreme points are 0
+    and 1, where the quantiles are the minimum and maximum.
+
+    Examples
+    --------
+    >>> _probabilities(5, 100)
+    array([0.  , 0.01, 0.5 , 0.99, 1.  ])
+    """
+    if n_points < 3:
+        raise ValueError(f"n_points must be at least 3; got {n_points}")
+    tail = min(max(1 / max(n_values, 1), 1e-6), 0.25)
+    bound = np.log((1 - tail) / tail)
+    logits = np.linspace(-bound, bound, n_points - 2)
+    return np.concatenate([[0.0], 1 / (1 + np.exp(-logits)), [1.0]])
+
+
+class _DenseStore:
+    """Counts of integer bucket keys, stored in a contiguous array."""
+
+    def __init__(self):
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def _extend(self, lo, hi):
+        """Grow the array to cover the keys lo to hi."""
+        if not len(self.counts):
+            self.offset, self.counts = lo, np.zeros(hi - lo + 1, dtype=np.int64)
+            return
+        lo, hi = min(lo, self.offset), max(hi, self.offset + len(self.counts) - 1)
+        counts = np.zeros(hi - lo + 1, dtype=np.int64)
+        start = self.offset - lo
+        stop = start + len(self.counts)
+        counts[start:stop] = self.counts
+        self.offset, self.counts = lo, counts
+
+    def add(self, keys):
+        if not len(keys):
+            return
+        lo, hi = int(keys.min()), int(keys.max())
+        self._extend(lo, hi)
+        counts = np.bincount(keys - lo)
+        start = lo - self.offset
+        stop = start + len(counts)
+        self.counts[start:stop] += counts
+
+    def merge(self, other):
+        if not len(other.counts):
+            return
+        self._extend(other.offset, other.offset + len(other.counts) - 1)
+        start = other.offset - self.offset
+        stop = start + len(other.counts)
+        self.counts[start:stop] += other.counts
+
+    def keys(self):
+        return self.offset + np.arange(len(self.counts))
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with a relative accuracy guarantee.
+
+    Values are counted in logarithmically sized buckets, as in DDSketch
+    (Masson et al., 2019): every quantile is estimated to within
+    ``relative_accuracy`` times its true value, however far in the tails,
+    while memory grows only with the logarithm of the range of the values.
+    Sketches of separate chunks of data can be merged into the sketch of all
+    the data. The minimum and maximum are tracked exactly.
+
+    Parameters
+    ----------
+    relative_accuracy : float
+        Relative accuracy of the estimated quantiles.
+
+    Examples
+    --------
+    >>> sketch = QuantileSketch(relative_accuracy=0.01)
+    >>> sketch.update(np.arange(1, 1001))
+    >>> other = QuantileSketch(relative_accuracy=0.01)
+    >>> other.update(np.arange(1001, 2001))
+    >>> sketch.merge(other)
+    >>> len(sketch)
+    2000
+    >>> exact = np.quantile(np.arange(1, 2001), [0.5, 0.999])
+    >>> bool(np.all(abs(sketch.quantile([0.5, 0.999]) / exact - 1) <= 0.01))
+    True
+    >>> sketch.quantile([0, 1]).tolist()
+    [1.0, 2000.0]
+    """
+
+    def __init__(self, relative_accuracy=0.005):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1.")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self._gamma)
+        self._positive = _DenseStore()
+        self._negative = _DenseStore()
+        self._zeros = 0
+        self._min = np.inf
+        self._max = -np.inf
+
+    def __len__(self):
+        return int(
+            self._positive.counts.sum() + self._negative.counts.sum() + self._zeros
+        )
+
+    def _keys(self, magnitudes):
+        return np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+
+    def update(self, values):
+        """Add values to the sketch; missing and infinite values are ignored."""
+        values = np.asarray(values, dtype=float)
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return
+        self._min = min(self._min, values.min())
+        self._max = max(self._max, values.max())
+        tiny = np.finfo(float).tiny
+        self._positive.add(self._keys(values[values >= tiny]))
+        self._negative.add(self._keys(-values[values <= -tiny]))
+        self._zeros += int(np.count_nonzero(np.abs(values) < tiny))
+
+    def merge(self, other):
+        """Add the values counted by another sketch of the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches of different accuracies.")
+        self._positive.merge(other._positive)
+        self._negative.merge(other._negative)
+        self._zeros += other._zeros
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+    def quantile(self, q):
+        """Estimate the quantiles at the probabilities ``q``.
+
+        As for ``numpy.quantile``, the quantile at probability p is the value
+        of rank ``p * (n - 1)`` among the n values, in increasing order.
+        """
+        q = np.asarray(q, dtype=float)
+        n = len(self)
+        if not n:
+            return np.full(q.shape, np.nan)[()]
+        # Representative values of all buckets, in increasing order.
+        scale = 2 / (1 + self._gamma)
+        values = np.concatenate(
+            [
+                -scale * self._gamma ** self._negative.keys()[::-1],
+                [0.0],
+                scale * self._gamma ** self._positive.keys(),
+            ]
+        )
+        counts = np.concatenate(
+            [self._negative.counts[::-1], [self._zeros], self._positive.counts]
+        )
+        cumulative = np.cumsum(counts)
+
+        def ranked(rank):
+            index = np.searchsorted(cumulative, rank, side="right")
+            return values[np.minimum(index, len(values) - 1)]
+
+        # Interpolate linearly between the values of the neighbouring ranks.
+        rank = np.clip(q, 0, 1) * (n - 1)
+        low = np.floor(rank)
+        below, above = ranked(low), ranked(np.minimum(low + 1, n - 1))
+        result = np.clip(below + (rank - low) * (above - below), self._min, self._max)
+        result = np.where(q <= 0, self._min, np.where(q >= 1, self._max, result))
+        return result[()]
+
+
+def _sketch(values, n_jobs=None):
+    """Sketch values chunk by chunk, in parallel, merging the chunk sketches."""
+    chunks = np.array_split(values, max(-(-len(values) // _CHUNK_SIZE), 1))
+
+    def sketch(chunk):
+        result = QuantileSketch()
+        result.update(chunk)
+        return result
+
+    result = QuantileSketch()
+    for chunk_sketch in _map_columns(sketch, chunks, n_jobs):
+        result.merge(chunk_sketch)
+    return result
+
+
+def _quantile_table(data, n_points=DEFAULT_N_POINTS, method="auto", n_jobs=None):
+    """Quantiles of each column of data, evaluated at ``n_points`` probabilities.
+
+    Parameters
+    ----------
+    data : DataFrame
+        Numeric columns; missing and infinite values are ignored.
+    n_points : int
+        Number of probabilities at which the quantiles of each column are
+        evaluated, whatever its size.
+    method : {'auto', 'exact', 'sketch'}
+        Compute exact quantiles, or estimate them with a ``QuantileSketch``.
+        ``'auto'`` uses exact quantiles for columns of up to a million values.
+    n_jobs : int, optional
+        Number of threads processing the columns (or the chunks of a sketched
+        column); see ``set_option``.
+
+    Returns
+    -------
+    table : DataFrame
+        Long-form table with columns ``"column"``, ``"probability"`` and
+        ``"value"``.
+
+    Examples
+    --------
+    >>> data = pd.DataFrame({"x": [3.0, 1.0, np.nan, 2.0]})
+    >>> _quantile_table(data, n_points=5)
+      column  probability  value
+    0      x         0.00    1.0
+    1      x         0.25    1.5
+    2      x         0.50    2.0
+    3      x         0.75    2.5
+    4      x         1.00    3.0
+    """
+    if method not in ("auto", "exact", "sketch"):
+        raise ValueError("method must be 'auto', 'exact' or 'sketch'.")
+
+    def valid(col):
+        values = data[col].to_numpy(dtype=float, na_value=np.nan)
+        return values[np.isfinite(values)]
+
+    def quantiles(values):
+        probabilities = _probabilities(n_points, len(values))
+        if not len(values):
+            return probabilities, np.full(n_points, np.nan)
+        if method == "exact" or (method == "auto" and len(values) <= _EXACT_MAX_VALUES):
+            return probabilities, np.quantile(values, probabilities)
+        return probabilities, _sketch(values, n_jobs).quantile(probabilities)
+
+    columns = list(data.columns)
+    if not columns:
+        return pd.DataFrame({"column": [], "probability": [], "value": []})
+    sketched = method == "sketch" or (
+        method == "auto" and len(data) > _EXACT_MAX_VALUES
+    )
+    # Sketched columns are split into chunks processed in parallel instead.
+    column_jobs = 1 if sketched else n_jobs
+    values = _map_columns(valid, columns, column_jobs)
+    results = _map_columns(quantiles, values, column_jobs)
+    return pd.DataFrame(
+        {
+            "column": np.repeat(columns, n_points),
+            "probability": np.concatenate([p for p, _ in results]),
+            "value": np.concatenate([v for _, v in results]),
+        }
+    )
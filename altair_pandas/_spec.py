@@ -0,0 +1,168 @@
+"""Fast path rendering plot specifications from pre-validated templates."""
+import sys
+from collections import OrderedDict
+
+import altair as alt
+import pandas as pd
+
+try:
+    from altair.utils.core import infer_vegalite_type_for_pandas as _infer_type
+except ImportError:  # Altair < 5
+    from altair.utils.core import infer_vegalite_type as _infer_type
+
+from ._core import _Deferred, _PandasPlotter
+from ._misc import _preprocess_data, scatter_matrix
+
+# Altair's API module, whose helpers name datasets and selections as to_dict() does.
+_api = sys.modules[alt.Chart.__module__]
+
+#: Maximum number of cached templates; the least recently used are dropped.
+MAX_TEMPLATES = 256
+
+_templates = OrderedDict()
+
+
+def _data_signature(data):
+    """Everything about the plotted data which can affect a chart's spec.
+
+    Encoding types are inferred by Altair from the column values, so they are
+    part of the signature along with the column names.
+    """
+    return tuple((col, repr(_infer_type(data[col]))) for col in data.columns)
+
+
+def _column_names(data):
+    """Names of the columns of the input data, or the name of a Series.
+
+    Folded data (``prefold=True``) only holds codes of the column names, so
+    these are part of the template key along with the signature of the data.
+    """
+    return tuple(data.columns) if isinstance(data, pd.DataFrame) else (data.name,)
+
+
+def _selection_names(spec):
+    """Names of the selections defined anywhere in spec."""
+    names = []
+    if isinstance(spec, dict):
+        for key, value in spec.items():
+            if key == "selection" and isinstance(value, dict):
+                names.extend(value)  # Vega-Lite 4
+            elif key == "params" and isinstance(value, list):
+                names.extend(param["name"] for param in value if "select" in param)
+            names.extend(_selection_names(value))
+    elif isinstance(spec, list):
+        for value in spec:
+            names.extend(_selection_names(value))
+    return names
+
+
+def _new_selection_name(name):
+    """Draw the name the next selection would get from Altair.
+
+    Altair 4 numbers selections (and Altair 5 parameters) with a global counter,
+    which building a chart advances. Later versions derive names from the
+    selection definition, which the template does not change.
+    """
+    counter = getattr(_api, "Selection", None) or getattr(_api, "Parameter", None)
+    if hasattr(counter, "_get_name"):
+        return counter._get_name()
+    return name
+
+
+def _has_key(spec, key):
+    """Whether ``key`` is set in any dict within spec."""
+    if isinstance(spec, dict):
+        return key in spec or any(_has_key(value, key) for value in spec.values())
+    if isinstance(spec, list):
+        return any(_has_key(value, key) for value in spec)
+    return False
+
+
+def _rename(spec, names):
+    """Copy of spec with dict keys and strings in ``names`` renamed."""
+    if isinstance(spec, dict):
+        return {names.get(k, k): _rename(v, names) for k, v in spec.items()}
+    if isinstance(spec, list):
+        return [_rename(value, names) for value in spec]
+    if isinstance(spec, str):
+        return names.get(spec, spec)
+    return spec
+
+
+class _Template:
+    """A validated chart spec, with its data reference and selections left open.
+
+    ``create`` returns None if the spec cannot be templated: when it has
+    several datasets, or when its selections refer to views, which recent
+    Altair versions name after a hash of the whole chart, data included.
+    """
+
+    def __init__(self, spec, dataset, selections):
+        self._spec = spec
+        self._dataset = dataset
+        self._selections = selections
+
+    @classmethod
+    def create(cls, spec):
+        if len(spec.get("datasets", {})) != 1 or _has_key(spec, "views"):
+            return None
+        spec = dict(spec)
+        (dataset,) = spec.pop("datasets")
+        return cls(spec, dataset, _selection_names(spec))
+
+    def fill(self, data):
+        """Return the spec of the chart of data."""
+        values = alt.data_transformers.get()(data)["values"]
+        name = _api._dataset_name(values)
+        names = {old: _new_selection_name(old) for old in self._selections}
+        names[self._dataset] = name
+        spec = _rename(self._spec, names)
+        spec["datasets"] = {name: values}
+        return spec
+
+
+def plot_spec(data, kind="line", n_jobs=None, **kwargs):
+    """Return the Vega-Lite spec of ``plot(data, kind, **kwargs)``.
+
+    The result is identical to ``plot(data, kind, **kwargs).to_dict()`` (or to
+    ``scatter_matrix(data, **kwargs).to_dict()`` for ``kind="scatter_matrix"``), but
+    the spec is only built and validated against the Vega-Lite schema once for
+    each combination of plot kind, input type, arguments, column names and
+    inferred column types. Later calls fill the cached template with a
+    reference to the new data, which makes rendering many small charts much
+    faster. At most ``MAX_TEMPLATES`` templates are kept, the least recently
+    used being dropped first.
+    """
+    if kind == "scatter_matrix":
+        deferred = _Deferred(
+            lambda data: scatter_matrix(data, **kwargs), _preprocess_data(data)
+        )
+    else:
+        plotter = _PandasPlotter.create(data, n_jobs)
+        if not hasattr(plotter, kind):
+            raise NotImplementedError(f"kind='{kind}' for data of type {type(data)}")
+        plotter._defer = True
+        deferred = getattr(plotter, kind)(**kwargs)
+    if not isinstance(deferred, _Deferred):
+        # Streaming and zoomable charts wrap a chart built as usual.
+        return deferred.chart.to_dict()
+
+    key = (
+        kind,
+        type(data),
+        repr(sorted(kwargs.items())),
+        _column_names(data),
+        _data_signature(deferred.data),
+        alt.themes.active,
+        alt.data_transformers.active,
+    )
+    template = _templates.get(key)
+    if template is not None:
+        _templates.move_to_end(key)
+        return template.fill(deferred.data)
+    spec = deferred.build(deferred.data).to_dict()
+    _templates[key] = _Template.create(spec)
+    _templates.move_to_end(key)
+    if len(_templates) > MAX_TEMPLATES:
+        _templates.popitem(last=False)
+    return spec
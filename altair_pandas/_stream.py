@@ -0,0 +1,177 @@
+"""Incremental updates of charts of growing data."""
+import numpy as np
+import pandas as pd
+
+try:
+    from altair.utils import sanitize_pandas_dataframe as _sanitize
+except ImportError:  # Altair < 5.4
+    from altair.utils import sanitize_dataframe as _sanitize
+
+from ._missing import _drop_missing, _invalid_cells
+
+
+class _RingBuffer:
+    """Column-wise buffer of the most recent rows of a DataFrame.
+
+    Appending ``k`` rows costs O(k); with ``max_rows=None`` the buffer grows
+    by doubling, so that appends stay O(k) amortized.
+    """
+
+    def __init__(self, data, max_rows=None):
+        self._columns = list(data.columns)
+        self._dtypes = data.dtypes
+        self._max_rows = max_rows
+        capacity = max(max_rows or 2 * len(data), 1)
+        self._arrays = [
+            np.empty(capacity, dtype=data[col].to_numpy().dtype)
+            for col in self._columns
+        ]
+        self._start = 0
+        self._size = 0
+        self.append(data)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self):
+        return len(self._arrays[0])
+
+    def _grow(self, needed):
+        frame = self.to_frame()
+        capacity = max(2 * self.capacity, needed)
+        self._arrays = [np.empty(capacity, dtype=arr.dtype) for arr in self._arrays]
+        self._start = self._size = 0
+        self._write(frame)
+
+    def _write(self, data):
+        positions = (self._start + self._size + np.arange(len(data))) % self.capacity
+        for arr, col in zip(self._arrays, self._columns):
+            arr[positions] = data[col].to_numpy()
+        self._size += len(data)
+
+    def append(self, data):
+        """Append the rows of ``data``, returning the number of evicted rows."""
+        if self._max_rows is None:
+            if self._size + len(data) > self.capacity:
+                self._grow(self._size + len(data))
+            self._write(data)
+            return 0
+        data = data.tail(self._max_rows)
+        evicted = max(self._size + len(data) - self._max_rows, 0)
+        self._start = (self._start + evicted) % self.capacity
+        self._size -= evicted
+        self._write(data)
+        return evicted
+
+    def to_frame(self):
+        """Return the buffered rows, oldest first."""
+        positions = (self._start + np.arange(self._size)) % self.capacity
+        data = pd.DataFrame(
+            {col: arr[positions] for col, arr in zip(self._columns, self._arrays)}
+        )
+        return data.astype(self._dtypes)
+
+
+class StreamingChart:
+    """Chart of a growing Series or DataFrame, updated with appended rows.
+
+    Instances are returned by the x/y plot kinds when called with
+    ``stream=True``. ``chart`` renders the buffered rows; ``append`` adds new
+    rows and returns only the change to apply to a rendered view, so that an
+    update costs time proportional to the number of new rows.
+
+    Parameters
+    ----------
+    plotter : _PandasPlotter
+        Plotter of the initial data; appended rows are preprocessed the same way.
+    build : callable
+        Function building a chart from the preprocessed data.
+    max_rows : int, optional
+        If given, only the most recent ``max_rows`` rows are kept.
+    columns : list of str, optional
+        The plotted columns. Rows where they are all missing or infinite are
+        dropped, from the initial data and from each appended batch.
+    keep_gaps : bool
+        Keep the first row of each run of dropped rows, so that lines are
+        broken there, including runs starting at the first row of a batch.
+    """
+
+    def __init__(self, plotter, build, max_rows=None, columns=None, keep_gaps=False):
+        self._plotter = plotter
+        self._build = build
+        self._max_rows = max_rows
+        self._columns = columns
+        self._keep_gaps = keep_gaps
+        # Whether the last row was invalid; a gap then continues into new rows.
+        self._after_gap = True
+        self._buffer = _RingBuffer(self._clean(plotter._preprocess_data()), max_rows)
+        self._dataset = None
+
+    def _clean(self, data):
+        """Drop the invalid rows of new data, as plots of the full data do."""
+        if self._columns is None or not len(data):
+            return data
+        cleaned = _drop_missing(
+            data, self._columns, keep_gaps=self._keep_gaps, after_gap=self._after_gap
+        )
+        self._after_gap = bool(_invalid_cells(data.tail(1), self._columns).all())
+        return cleaned
+
+    def __len__(self):
+        return len(self._buffer)
+
+    @property
+    def data(self):
+        """The buffered rows, as plotted."""
+        return self._buffer.to_frame()
+
+    @property
+    def chart(self):
+        """A chart of the currently buffered rows."""
+        return self._build(self.data).interactive()
+
+    def to_dict(self, *args, **kwargs):
+        """Render the full chart specification.
+
+        The name of its dataset is remembered as the target of later changes.
+        """
+        spec = self.chart.to_dict(*args, **kwargs)
+        self._dataset = spec["data"]["name"]
+        return spec
+
+    def _repr_mimebundle_(self, include=None, exclude=None):
+        self.to_dict()
+        return self.chart._repr_mimebundle_(include, exclude)
+
+    def append(self, data):
+        """Append rows to the chart.
+
+        Parameters
+        ----------
+        data : Series or DataFrame
+            New rows, of the same kind and with the same columns as the
+            plotted data.
+
+        Returns
+        -------
+        changeset : dict
+            The change to the rendered chart's dataset, with keys ``"name"``
+            (the dataset name, or None if the chart was not rendered yet),
+            ``"insert"`` (records of the new rows) and ``"evict"`` (the number
+            of oldest rows evicted from the buffer). Vega changesets remove
+            tuples rather than a number of rows; since a view keeps the tuples
+            of a dataset in insertion order, the evicted tuples are the first
+            ``evict`` ones::
+
+                const evicted = view.data(name).slice(0, change.evict);
+                const changes = vega.changeset().insert(change.insert);
+                view.change(name, changes.remove(evicted)).run();
+        """
+        data = self._plotter.create(data, self._plotter._n_jobs)._preprocess_data()
+        data = self._clean(data)
+        evicted = self._buffer.append(data)
+        if self._max_rows is not None:
+            data = data.tail(self._max_rows)
+        records = _sanitize(data).to_dict(orient="records")
+        return {"name": self._dataset, "insert": records, "evict": evicted}
@@ -0,0 +1,217 @@
+"""Downsampling and zoom-driven re-aggregation of x/y charts."""
+import altair as alt
+import numpy as np
+import pandas as pd
+
+from ._parallel import _column_blocks, _map_columns
+
+#: Default number of points per column shown by a zoomable chart.
+DEFAULT_MAX_POINTS = 1000
+
+
+def _downsample_index(values, max_points, n_jobs=None):
+    """Select the rows needed to draw ``values`` with about ``max_points`` points.
+
+    The rows are split into ``max_points // 2`` contiguous buckets, and the
+    minimum and maximum of each column within each bucket are kept, so that
+    peaks survive the downsampling. Missing values are never selected as
+    extremes, but the first missing value of each column within a bucket is
+    kept, so that lines are still broken at gaps in the data.
+
+    Parameters
+    ----------
+    values : array-like, shape (n_rows,) or (n_rows, n_columns)
+        Numeric values, in plotting order.
+    max_points : int
+        Approximate number of points to keep per column.
+    n_jobs : int, optional
+        Number of threads processing the columns; see ``set_option``.
+
+    Returns
+    -------
+    index : ndarray of ints
+        Sorted positions of the rows to keep.
+
+    Examples
+    --------
+    >>> _downsample_index([0, 5, 1, 2, 9, 3, 4, 8], max_points=4)
+    array([0, 1, 4, 5])
+    >>> _downsample_index([0, 1, 2], max_points=4)
+    array([0, 1, 2])
+    >>> _downsample_index([0, 5, 1, 2, 9, 3, np.nan, 8], max_points=4)
+    array([0, 1, 4, 5, 6])
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    n = len(values)
+    if n <= max_points:
+        return np.arange(n)
+    n_buckets = max(max_points // 2, 1)
+    bucket = np.arange(n) * n_buckets // n
+    starts = np.searchsorted(bucket, np.arange(n_buckets))
+    sizes = np.diff(np.append(starts, n))
+    # Rows of each bucket, padded to the same size by repeating the last row.
+    rows = starts[:, None] + np.minimum(np.arange(sizes.max()), sizes[:, None] - 1)
+
+    def extremes(block):
+        window = values[rows, block]
+        missing = np.isnan(window)
+        # Missing entries are pushed to the far end when looking for extremes.
+        low = np.where(missing, np.inf, window).argmin(axis=1)
+        high = np.where(missing, -np.inf, window).argmax(axis=1)
+        gaps = np.take_along_axis(rows, missing.argmax(axis=1), axis=1)
+        return np.concatenate(
+            [
+                np.take_along_axis(rows, low, axis=1).ravel(),
+                np.take_along_axis(rows, high, axis=1).ravel(),
+                gaps[missing.any(axis=1)],
+            ]
+        )
+
+    blocks = _column_blocks(values.shape[1], n_jobs)
+    return np.unique(np.concatenate(_map_columns(extremes, blocks, n_jobs)))
+
+
+def _visible_slice(keys, lo, hi):
+    """Slice of the sorted array ``keys`` covering the interval [lo, hi].
+
+    One extra point is kept on either side so lines run to the chart edges.
+
+    Examples
+    --------
+    >>> _visible_slice(np.arange(10), 2.5, 5)
+    slice(2, 7, None)
+    """
+    start = max(np.searchsorted(keys, lo, side="left") - 1, 0)
+    stop = min(np.searchsorted(keys, hi, side="right") + 1, len(keys))
+    return slice(start, stop)
+
+
+def _sort_keys(column):
+    """Numeric keys for the x column, as Vega-Lite reports them in selections.
+
+    Datetimes are expressed in milliseconds since the epoch.
+    """
+    if pd.api.types.is_datetime64_any_dtype(column):
+        if getattr(column.dt, "tz", None) is not None:
+            column = column.dt.tz_convert(None)
+        return column.to_numpy(dtype="datetime64[ns]").astype("int64") / 1e6
+    if pd.api.types.is_numeric_dtype(column):
+        return column.to_numpy(dtype=float)
+    raise ValueError(
+        f"zoom=True requires a numeric or datetime x axis; got {column.dtype}."
+    )
+
+
+def _numeric_values(data, columns):
+    """Values of the columns whose extremes are preserved when downsampling."""
+    non_numeric = [
+        col for col in columns if not pd.api.types.is_numeric_dtype(data[col])
+    ]
+    if non_numeric:
+        raise ValueError(
+            f"max_points requires numeric columns; got non-numeric {non_numeric}."
+        )
+    return data[columns].to_numpy(dtype=float, na_value=np.nan)
+
+
+def _zoom_channel(chart, x):
+    """Return the encoding channel ('x' or 'y') which displays the field ``x``."""
+    y = chart.encoding.y
+    return "y" if getattr(y, "shorthand", y) == x else "x"
+
+
+class _ZoomHandler:
+    """Re-slice and re-downsample a chart's data when its x-domain changes.
+
+    Parameters
+    ----------
+    build : callable
+        Function building a (non-interactive) chart from a DataFrame.
+    data : DataFrame
+        The full-resolution data to plot.
+    x : str
+        Name of the column shown on the zoomable axis.
+    columns : list of str
+        Names of the columns whose extremes are preserved when downsampling.
+    max_points : int
+        Approximate number of points per column shown at any zoom level.
+    n_jobs : int, optional
+        Number of threads downsampling the columns.
+    """
+
+    def __init__(
+        self, build, data, x, columns, max_points=DEFAULT_MAX_POINTS, n_jobs=None
+    ):
+        keys = _sort_keys(data[x])
+        if not (np.diff(keys) >= 0).all():
+            order = np.argsort(keys, kind="stable")
+            data, keys = data.iloc[order], keys[order]
+        self._build = build
+        self._data = data
+        self._keys = keys
+        self._x = x
+        self._columns = list(columns)
+        self._max_points = max_points
+        self._n_jobs = n_jobs
+        self._domain = None
+        self.widget = None
+
+    def window(self, domain=None):
+        """Return the downsampled rows visible within the x-domain [lo, hi]."""
+        data = self._data
+        if domain is not None:
+            data = data.iloc[_visible_slice(self._keys, *domain)]
+        values = _numeric_values(data, self._columns)
+        return data.iloc[_downsample_index(values, self._max_points, self._n_jobs)]
+
+    def chart(self, domain=None):
+        """Build the chart for the given x-domain, or for the full data."""
+        chart = self._build(self.window(domain))
+        channel = _zoom_channel(chart, self._x)
+        if domain is not None:
+            domain = [float(value) for value in domain]
+            getattr(chart.encoding, channel).scale = alt.Scale(domain=domain)
+        zoom = alt.selection_interval(bind="scales", encodings=[channel], name="zoom")
+        # Altair < 5 names this method add_selection.
+        add_params = getattr(chart, "add_params", None) or chart.add_selection
+        return add_params(zoom)
+
+    def _on_zoom(self, change):
+        domain = change["new"].value.get(self._x)
+        if not domain or domain == self._domain:
+            return
+        self._domain = domain
+        self._show(self.chart(domain))
+
+    def _show(self, chart):
+        self.widget.chart = chart
+        # JupyterChart creates a new selections object for every chart.
+        self.widget.selections.observe(self._on_zoom, ["zoom"])
+
+    def jupyter_chart(self):
+        """Return a JupyterChart which re-aggregates its data on zoom."""
+        if not hasattr(alt, "JupyterChart"):
+            raise ImportError("zoom=True requires altair>=5.1 and anywidget.")
+        self.widget = alt.JupyterChart(self.chart())
+        self.widget.selections.observe(self._on_zoom, ["zoom"])
+        return self.widget
+
+
+def _downsample(data, columns, max_points=None, n_jobs=None):
+    """Downsample the rows of data to about max_points per column, if given."""
+    if max_points is None:
+        return data
+    values = _numeric_values(data, columns)
+    return data.iloc[_downsample_index(values, max_points, n_jobs)]
+
+
+def _zoom_chart(build, data, x, columns, max_points=None, n_jobs=None):
+    """Return a JupyterChart whose data is re-sliced from ``data`` and
+    re-downsampled each time the x-domain changes.
+    """
+    if max_points is None:
+        max_points = DEFAULT_MAX_POINTS
+    handler = _ZoomHandler(build, data, x, columns, max_points, n_jobs)
+    return handler.jupyter_chart()
@@ -1,3 +1,4 @@
+import json
 import pytest
 import numpy as np
 import pandas as pd
@@ -332,3 +333,602 @@ def test_scatter_multiindex(indx, data, with_plotting_backend):
 
     for k, v in spec["repeat"].items():
         assert set(v) == cols
+
+
+def test_arrow_table_input(with_plotting_backend):
+    pa = pytest.importorskip("pyarrow")
+    from altair_pandas import plot
+
+    table = pa.table({"x": [1, None, 3], "y": [0.5, 1.0, 1.5], "z": ["a", "b", None]})
+    chart = plot(table, kind="scatter", x="x", y="y", c="z")
+    spec = chart.to_dict()
+    assert spec["encoding"]["x"] == {"field": "x", "type": "quantitative"}
+    assert spec["encoding"]["color"] == {"field": "z", "type": "nominal"}
+    assert str(chart.data["x"].dtype) == "float64"
+    assert str(chart.data["z"].dtype) == "string"
+    (values,) = spec["datasets"].values()
+    assert values == [{"x": 1.0, "y": 0.5, "z": "a"}, {"x": 3.0, "y": 1.5, "z": None}]
+
+
+def test_arrow_array_input(with_plotting_backend):
+    pa = pytest.importorskip("pyarrow")
+    from altair_pandas import plot
+
+    chart = plot(pa.chunked_array([[1, 2], [3]]), kind="line")
+    spec = chart.to_dict()
+    assert spec["encoding"]["y"] == {
+        "field": "0",
+        "title": None,
+        "type": "quantitative",
+    }
+    assert chart.data["0"].dtype == np.int64
+
+
+def test_arrow_input_old_pandas(monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    from altair_pandas import plot
+
+    monkeypatch.delattr(pd, "ArrowDtype", raising=False)
+    with pytest.raises(ImportError, match="pandas>=1.5"):
+        plot(pa.table({"x": [1, 2]}), kind="line")
+
+
+@pytest.mark.parametrize("kind", ["line", "bar", "hist", "box"])
+def test_arrow_dtype_columns(kind, with_plotting_backend):
+    pa = pytest.importorskip("pyarrow")
+    if not hasattr(pd, "ArrowDtype"):
+        pytest.skip("pd.ArrowDtype requires pandas 1.5")
+
+    data = pa.table({"x": [1, 2, 3], "y": [1.0, None, 3.0]})
+    native = data.to_pandas()
+    arrow_backed = data.to_pandas(types_mapper=pd.ArrowDtype)
+    specs = [df.plot(kind=kind).to_dict() for df in (arrow_backed, native)]
+    for spec in specs:
+        spec.pop("selection", None)  # selection names are auto-generated.
+    assert specs[0] == specs[1]
+
+
+@pytest.mark.parametrize("kind", ["line", "area", "bar", "barh"])
+def test_series_max_points(kind, with_plotting_backend):
+    data = pd.Series(np.sin(np.arange(10000) / 100.0), name="data_name")
+    data.iloc[1234] = 5.0
+    chart = data.plot(kind=kind, max_points=200)
+    assert len(chart.data) <= 200
+    assert chart.data["data_name"].max() == 5.0
+    assert chart.data["index"].is_monotonic_increasing
+
+
+def test_max_points_non_numeric(with_plotting_backend):
+    data = pd.DataFrame({"a": [1.0, 2.0, 3.0], "s": ["x", "y", "z"]})
+    data.plot.line()
+    with pytest.raises(ValueError, match=r"numeric columns.*\['s'\]"):
+        data.plot.line(max_points=2)
+
+
+def test_dataframe_max_points(with_plotting_backend):
+    data = pd.DataFrame({"x": np.arange(1000), "y": -np.arange(1000)})
+    chart = data.plot.line(max_points=10)
+    # Extremes of every column are kept: rows are selected per column.
+    assert len(chart.data) <= 20
+    assert {0, 999} <= set(chart.data["index"])
+
+    chart = data.plot.scatter("x", "y", max_points=10)
+    assert len(chart.data) <= 10
+    assert chart.to_dict()["encoding"]["x"]["field"] == "x"
+
+
+def test_zoom_window():
+    from altair_pandas._zoom import _ZoomHandler
+
+    index = pd.date_range("2020-01-01", periods=10000, freq="s")
+    data = pd.DataFrame({"index": index, "y": np.arange(10000.0)}).iloc[::-1]
+
+    def build(data):
+        return alt.Chart(data).mark_line().encode(x="index", y="y")
+
+    handler = _ZoomHandler(build, data, "index", ["y"], max_points=100)
+    assert len(handler.window()) <= 100
+    lo, hi = (index[[5000, 5010]] - pd.Timestamp(0)) // pd.Timedelta("1ms")
+    window = handler.window((lo, hi))
+    assert list(window["y"]) == list(range(4999, 5012))
+
+    chart = handler.chart((lo, hi))
+    spec = chart.to_dict()
+    assert spec["encoding"]["x"]["scale"] == {"domain": [lo, hi]}
+    if "params" in spec:  # Altair 5
+        selections = {param["name"]: param["select"] for param in spec["params"]}
+    else:
+        selections = spec["selection"]
+    assert selections["zoom"]["encodings"] == ["x"]
+
+
+def test_downsample_keeps_gaps(with_plotting_backend):
+    from altair_pandas._zoom import _ZoomHandler
+
+    values = np.arange(10000.0)
+    values[[1234, 1235, 7000]] = np.nan
+    data = pd.Series(values, name="y")
+    spec = data.plot.line(max_points=100).to_dict()
+    (rows,) = spec["datasets"].values()
+    # The first missing value of each gap still breaks the line.
+    assert [row["index"] for row in rows if row["y"] is None] == [1234, 7000]
+
+    frame = data.reset_index()
+    handler = _ZoomHandler(None, frame, "index", ["y"], max_points=20)
+    window = handler.window((1000, 1500))
+    assert window["y"].isna().sum() == 1
+    assert len(window) <= 21
+
+
+def test_zoom_requires_jupyter_chart(series, with_plotting_backend):
+    if hasattr(alt, "JupyterChart"):
+        pytest.skip("JupyterChart is available")
+    with pytest.raises(ImportError):
+        series.plot.line(zoom=True)
+
+
+def test_zoom_jupyter_chart(with_plotting_backend):
+    if not hasattr(alt, "JupyterChart"):
+        pytest.skip("JupyterChart requires altair>=5.1")
+    data = pd.Series(np.arange(5000.0), name="data_name")
+    widget = data.plot.line(zoom=True, max_points=100)
+    assert len(widget.chart.data) == 100
+
+    # Simulate the frontend reporting zooms, as a kernel would receive them.
+    for lo, hi in [(100, 200), (150, 160)]:
+        widget._vl_selections = {"zoom": {"value": {"index": [lo, hi]}, "store": []}}
+        visible = widget.chart.data["index"]
+        assert visible.min() == lo - 1 and visible.max() == hi + 1
+
+    # Gaps survive the re-aggregation on zoom.
+    data[[120, 121]] = np.nan
+    widget = data.plot.line(zoom=True, max_points=10)
+    widget._vl_selections = {"zoom": {"value": {"index": [100, 200]}, "store": []}}
+    window = widget.chart.data.set_index("index")["data_name"]
+    assert window.isna().sum() == 1 and np.isnan(window[120])
+
+
+def test_dashboard(dataframe, with_plotting_backend):
+    from altair_pandas import Dashboard
+
+    dataframe["z"] = ["A", "B", "C", "D", "E"]
+    dashboard = (
+        Dashboard(dataframe, columns=3)
+        .plot("line", y="x")
+        .plot("hist", bins=5)
+        .plot("box")
+        .plot("scatter", x="x", y="y", c="z")
+        .hist_frame()
+        .scatter_matrix(color="z")
+    )
+    spec = dashboard.to_chart().to_dict()
+    assert spec["columns"] == 3
+    assert len(spec["concat"]) == 6
+    # The frame is embedded once, and inherited by every panel.
+    (values,) = spec["datasets"].values()
+    assert values[0] == {"index": 0, "x": 0, "y": 0, "z": "A"}
+    assert spec["data"] == {"name": next(iter(spec["datasets"]))}
+    for panel in spec["concat"]:
+        assert "data" not in panel and "data" not in panel.get("spec", {})
+    assert spec["concat"][1]["transform"][0]["fold"] == ["x", "y", "z"]
+    assert spec["concat"][4]["repeat"] == ["x", "y"]
+
+
+def test_dashboard_panel_data(with_plotting_backend):
+    from altair_pandas import Dashboard
+
+    data = pd.DataFrame({"x": np.arange(100.0), "y": np.arange(100.0)})
+    spec = Dashboard(data).plot("line").plot("line", max_points=10).to_chart()
+    spec = spec.to_dict()
+    # Downsampled panels keep their own (smaller) data.
+    assert "data" not in spec["concat"][0]
+    assert "data" in spec["concat"][1]
+    assert len(spec["datasets"]) == 2
+
+
+@pytest.mark.parametrize("option", ["stream", "zoom"])
+def test_dashboard_rejects_non_chart_panels(option, with_plotting_backend):
+    from altair_pandas import Dashboard
+
+    data = pd.DataFrame({"x": np.arange(10.0), "y": np.arange(10.0)})
+    with pytest.raises(ValueError, match=f"{option}=True"):
+        Dashboard(data).plot("line", **{option: True})
+
+
+def test_dashboard_missing_values(with_plotting_backend):
+    from altair_pandas import Dashboard
+
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame({"x": rng.randn(100), "y": rng.randn(100)})
+    data[rng.rand(100, 2) < 0.9] = np.nan
+    dashboard = Dashboard(data, columns=3)
+    for kind in ["line", "area", "hist", "box", "scatter"]:
+        dashboard.plot(kind, **({"x": "x", "y": "y"} if kind == "scatter" else {}))
+    spec = dashboard.to_chart().to_dict()
+    # Lines and areas share one cleaned table, which is the top-level data;
+    # histograms and box plots share the compacted table.
+    assert len(spec["datasets"]) == 3
+    names = [panel.get("data", spec["data"])["name"] for panel in spec["concat"]]
+    assert names[0] == names[1] == spec["data"]["name"]
+    assert names[2] == names[3] != names[0]
+    assert set(names) == set(spec["datasets"])
+    # The dashboard can be rendered again.
+    assert dashboard.to_chart().to_dict() == spec
+
+
+def test_dashboard_sparse_payload(with_plotting_backend):
+    from altair_pandas import Dashboard
+
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame(rng.randn(2000, 10), columns=list("abcdefghij"))
+    sparse = data.mask(rng.rand(2000, 10) < 0.9)
+
+    def payload(data):
+        dashboard = Dashboard(data)
+        for column in data.columns:
+            dashboard.plot("line", y=column)
+        return dashboard.to_chart().to_dict()
+
+    spec = payload(sparse)
+    # Each panel only embeds the valid cells (and gaps) of its own column.
+    for values in spec["datasets"].values():
+        assert len(values[0]) == 2
+    assert len(json.dumps(spec)) < len(json.dumps(payload(sparse.fillna(0)))) / 1.5
+
+
+@pytest.mark.parametrize("kind", ["line", "area"])
+def test_series_stream(kind, with_plotting_backend):
+    from altair_pandas import StreamingChart
+
+    data = pd.Series(np.arange(5.0), name="data_name")
+    stream = data.plot(kind=kind, stream=True, max_rows=8)
+    assert isinstance(stream, StreamingChart)
+    spec = stream.to_dict()
+    assert spec["mark"] == {"type": kind}
+    assert len(spec["datasets"][spec["data"]["name"]]) == 5
+
+    new = pd.Series([5.0, 6.0], index=[5, 6], name="data_name")
+    change = stream.append(new)
+    assert change == {
+        "name": spec["data"]["name"],
+        "insert": [{"index": 5, "data_name": 5.0}, {"index": 6, "data_name": 6.0}],
+        "evict": 0,
+    }
+    new = pd.Series(np.arange(7.0, 11.0), index=range(7, 11), name="data_name")
+    change = stream.append(new)
+    assert len(change["insert"]) == 4
+    assert change["evict"] == 3
+    assert list(stream.data["index"]) == list(range(3, 11))
+    assert stream.data["data_name"].dtype == np.float64
+
+    # Only the last max_rows of a large batch are kept.
+    new = pd.Series(np.arange(11.0, 31.0), index=range(11, 31), name="data_name")
+    change = stream.append(new)
+    assert [row["index"] for row in change["insert"]] == list(range(23, 31))
+    assert change["evict"] == 8
+
+
+@pytest.mark.parametrize("max_rows", [None, "size"])
+def test_stream_append_cost(max_rows, monkeypatch, with_plotting_backend):
+    from altair_pandas import _stream
+
+    # Count the rows which an append copies into the buffer and serializes.
+    touched = []
+    write, sanitize = _stream._RingBuffer._write, _stream._sanitize
+
+    def counting_write(self, data):
+        touched.append(len(data))
+        return write(self, data)
+
+    def counting_sanitize(data):
+        touched.append(len(data))
+        return sanitize(data)
+
+    monkeypatch.setattr(_stream._RingBuffer, "_write", counting_write)
+    monkeypatch.setattr(_stream, "_sanitize", counting_sanitize)
+    for size in [10_000, 1_000_000]:
+        data = pd.Series(np.arange(float(size)), name="data_name")
+        stream = data.plot(stream=True, max_rows=size if max_rows else None)
+        new = pd.Series(np.arange(10.0), index=range(size, size + 10), name="data_name")
+        del touched[:]
+        change = stream.append(new)
+        assert len(change["insert"]) == 10
+        # The cost of an append does not depend on the size of the buffer.
+        assert touched == [10, 10]
+
+
+def test_stream_missing_values(with_plotting_backend):
+    data = pd.Series([1.0, np.nan, np.nan, np.inf, 3.0], name="data_name")
+    stream = data.plot(stream=True)
+    assert stream.data.equals(data.plot().data.reset_index(drop=True))
+
+    def append(values):
+        new = pd.Series(values, name="data_name")
+        return [row["data_name"] for row in stream.append(new)["insert"]]
+
+    # Gaps starting at the first row of a batch still break the line...
+    assert append([np.nan, np.nan, 4.0, np.inf]) == [None, 4.0, None]
+    # ... but continue the gap at the end of the previous batch.
+    assert append([np.nan, 5.0]) == [5.0]
+    assert stream.data["data_name"].isna().sum() == 3
+
+    stream = data.plot.bar(stream=True)
+    assert stream.data["data_name"].tolist() == [1.0, 3.0]
+    assert append([np.nan, 4.0]) == [4.0]
+
+
+def test_dataframe_stream(dataframe, with_plotting_backend):
+    stream = dataframe.plot.line(stream=True)
+    for start in range(5, 100, 5):
+        index = range(start, start + 5)
+        new = pd.DataFrame({"x": range(5), "y": range(5)}, index=index)
+        change = stream.append(new)
+        assert len(change["insert"]) == 5
+        assert change["evict"] == 0
+    assert len(stream) == 100
+    assert list(stream.data["index"]) == list(range(100))
+    spec = stream.chart.to_dict()
+    assert spec["transform"][0]["fold"] == ["x", "y"]
+
+
+@pytest.mark.parametrize("kind", ["line", "area", "bar", "barh"])
+def test_series_missing_values(kind, with_plotting_backend):
+    data = pd.Series([1.0, np.nan, np.nan, np.inf, 5.0, -np.inf], name="data_name")
+    chart = data.plot(kind=kind)
+    (values,) = chart.to_dict()["datasets"].values()
+    if kind in ("line", "area"):
+        # A single null breaks the line, as in pandas.
+        assert values == [
+            {"index": 0, "data_name": 1.0},
+            {"index": 1, "data_name": None},
+            {"index": 4, "data_name": 5.0},
+            {"index": 5, "data_name": None},
+        ]
+    else:
+        assert values == [
+            {"index": 0, "data_name": 1.0},
+            {"index": 4, "data_name": 5.0},
+        ]
+
+
+def test_dataframe_missing_values(with_plotting_backend):
+    data = pd.DataFrame(
+        {"x": [1.0, np.nan, np.nan, np.nan], "y": [np.nan, np.nan, np.inf, 4.0]}
+    )
+    chart = data.plot.line()
+    assert list(chart.data["index"]) == [0, 1, 3]
+    assert chart.data["y"].isna().tolist() == [True, True, False]
+
+    chart = data.plot.scatter(x="x", y="y")
+    assert len(chart.data) == 0
+
+
+@pytest.mark.parametrize("kind", ["hist", "box"])
+def test_sparse_columns(kind, with_plotting_backend):
+    data = pd.DataFrame(np.full((100, 3), np.nan), columns=["a", "b", "c"])
+    data.iloc[::10, 0] = 1.0
+    data.iloc[5::20, 1] = np.inf
+    data.iloc[1::25, 2] = 2.0
+    chart = data.plot(kind=kind)
+    assert chart.to_dict()["transform"][0]["fold"] == ["a", "b", "c"]
+    assert len(chart.data) == 10
+    assert chart.data["a"].tolist() == [1.0] * 10
+    assert chart.data["b"].isna().all()
+    assert chart.data["c"].count() == 4
+
+    chart = data["a"].plot(kind=kind)
+    assert len(chart.data) == 10
+
+
+@pytest.mark.parametrize(
+    "kind, kwargs",
+    [
+        ("line", {}),
+        ("line", {"alpha": 0.5, "color": "red"}),
+        ("area", {"stacked": False}),
+        ("bar", {}),
+        ("barh", {}),
+        ("hist", {"bins": 5, "orientation": "horizontal"}),
+        ("box", {"vert": False}),
+        ("ecdf", {"n_points": 10}),
+        ("quantile", {}),
+        ("scatter", {"x": "x", "y": "y", "c": "z"}),
+        ("hist_frame", {"layout": (-1, 1)}),
+        ("scatter_matrix", {"color": "z", "tooltip": ["x", "y"]}),
+        ("line", {"prefold": True}),
+        ("area", {"prefold": True}),
+        ("bar", {"prefold": True}),
+        ("hist", {"prefold": True}),
+        ("box", {"prefold": True}),
+    ],
+)
+@pytest.mark.parametrize("series", [False, True])
+def test_plot_spec_parity(kind, kwargs, series, with_plotting_backend):
+    from altair_pandas import plot, hist_frame, scatter_matrix, plot_spec
+    from altair_pandas._spec import _rename, _selection_names
+
+    if series and kind in ("scatter", "hist_frame", "scatter_matrix"):
+        pytest.skip(f"kind={kind!r} requires a DataFrame")
+    prefold = kwargs.get("prefold", False)
+    if series and prefold and kind != "box":
+        pytest.skip(f"kind={kind!r} does not support prefold for a Series")
+    functions = {"hist_frame": hist_frame, "scatter_matrix": scatter_matrix}
+
+    for i in range(3):
+        y = [1.0, np.nan, 3.0, np.inf, i]
+        data = pd.DataFrame({"x": range(i, i + 5), "y": y, "z": list("abcde")})
+        if prefold:
+            # Folded data only holds codes of the column names, so change those.
+            data = data[["x", "y"]].rename(columns={"y": "abc"[i]})
+        if series:
+            data = data.iloc[:, 1]
+        if kind in functions:
+            expected = functions[kind](data, **kwargs).to_dict()
+        else:
+            expected = plot(data, kind, **kwargs).to_dict()
+        spec = plot_spec(data, kind, **kwargs)
+        # Auto-generated selection names differ between two successive charts.
+        names = dict(zip(_selection_names(spec), _selection_names(expected)))
+        assert json.dumps(_rename(spec, names)) == json.dumps(expected)
+
+
+@pytest.mark.parametrize("kind", ["line", "area", "hist", "box", "hist_frame"])
+def test_n_jobs(kind, with_plotting_backend):
+    from altair_pandas import plot, hist_frame, get_option, set_option
+    from altair_pandas._spec import _rename, _selection_names
+
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame(rng.randn(500, 6), columns=list("abcdef"))
+    data.iloc[::7, 2] = np.nan
+    data.iloc[::11, 4] = np.inf
+    kwargs = {"max_points": 50} if kind in ("line", "area") else {}
+
+    def spec(**options):
+        if kind == "hist_frame":
+            return hist_frame(data, **options, **kwargs).to_dict()
+        spec = plot(data, kind, **options, **kwargs).to_dict()
+        # Auto-generated selection names differ between successive charts.
+        names = {name: f"selector{i}" for i, name in enumerate(_selection_names(spec))}
+        return _rename(spec, names)
+
+    expected = spec(n_jobs=1)
+    assert spec(n_jobs=4) == expected
+    assert spec(n_jobs=-1) == expected
+
+    assert get_option("n_jobs") == 1
+    set_option("n_jobs", 3)
+    try:
+        assert spec() == expected
+    finally:
+        set_option("n_jobs", 1)
+    with pytest.raises(KeyError):
+        set_option("no_such_option", 1)
+
+
+@pytest.mark.parametrize("kind", ["line", "area", "bar", "hist", "box"])
+def test_dataframe_prefold(kind, with_plotting_backend):
+    data = pd.DataFrame(
+        {"y": [1.0, np.nan, np.nan, 4.0], "x": [2.0, 3.0, np.inf, 5.0]},
+        index=pd.Index([10, 20, 30, 40], name="t"),
+    )
+    chart = data.plot(kind=kind, prefold=True)
+    spec = chart.to_dict()
+    assert "transform" not in spec
+
+    labels = ["x", "y"]
+    guide = "axis" if kind == "box" else "legend"
+    key = spec["encoding"]["x" if kind == "box" else "color"]
+    assert key["field"] == "column"
+    assert key[guide]["labelExpr"] == json.dumps(labels) + "[datum.value]"
+
+    folded = chart.data
+    assert list(folded["column"].unique()) == [1, 0]
+    values = {
+        labels[code]: group["value"].fillna(0).tolist()
+        for code, group in folded.groupby("column")
+    }
+    if kind in ("line", "area"):
+        # The first missing value of each run is kept to break lines.
+        assert values == {"y": [1.0, 0, 4.0], "x": [2.0, 3.0, 0, 5.0]}
+        assert folded["t"].tolist() == [10, 20, 40, 10, 20, 30, 40]
+    else:
+        assert values == {"y": [1.0, 4.0], "x": [2.0, 3.0, 5.0]}
+
+
+def test_dataframe_prefold_subplots():
+    from altair_pandas import plot
+
+    data = pd.DataFrame({"y": [1, 2], "x": [3, 4]})
+    chart = plot(data, "line", subplots=True, prefold=True)
+    # Faceting with "columns" fails validation; check the facet itself.
+    facet = chart.to_dict(validate=False)["encoding"]["facet"]
+    assert facet["header"]["labelExpr"] == '["x", "y"][datum.value]'
+    with pytest.raises(ValueError):
+        plot(data, "line", stream=True, prefold=True)
+
+
+@pytest.mark.parametrize("kind", ["line", "hist", "box"])
+def test_dataframe_prefold_non_numeric(kind):
+    from altair_pandas import plot
+
+    data = pd.DataFrame({"y": [1.0, 2.0], "s": ["a", "b"]})
+    chart = plot(data, kind, prefold=True)
+    # The string column is left out, as in hist_frame.
+    assert chart.data["column"].tolist() == [0, 0]
+    assert chart.data["value"].tolist() == [1.0, 2.0]
+    spec = chart.to_dict()
+    key = spec["encoding"]["x" if kind == "box" else "color"]
+    guide = key["axis" if kind == "box" else "legend"]
+    assert guide["labelExpr"] == '["y"][datum.value]'
+
+
+@pytest.mark.parametrize("kind", ["ecdf", "quantile"])
+@pytest.mark.parametrize("series", [False, True])
+def test_distribution_plots(kind, series, with_plotting_backend):
+    rng = np.random.RandomState(0)
+    data = pd.DataFrame({"x": rng.exponential(size=10000), "y": rng.randn(10000)})
+    data.iloc[::10, 0] = np.nan
+    if series:
+        data = data["x"]
+    chart = data.plot(kind=kind, n_points=50)
+    spec = chart.to_dict()
+
+    value, probability = ("x", "y") if kind == "ecdf" else ("y", "x")
+    assert spec["encoding"][value]["field"] == "value"
+    assert spec["encoding"][probability]["field"] == "probability"
+    assert ("color" in spec["encoding"]) is not series
+
+    table = chart.data
+    assert len(table) == (50 if series else 100)
+    x = table[table["column"] == "x"]
+    assert x["value"].tolist() == list(
+        np.quantile(data.dropna() if series else data["x"].dropna(), x["probability"])
+    )
+    # The probabilities reach far into the tails.
+    assert x["probability"].iloc[-2] > 0.999
+
+
+@pytest.mark.parametrize("kind", ["ecdf", "quantile"])
+def test_distribution_plots_non_numeric(kind, with_plotting_backend):
+    data = pd.DataFrame({"x": [1.0, 2.0], "s": ["a", "b"]})
+    # Non-numeric columns of a DataFrame are left out.
+    assert set(data.plot(kind=kind, n_points=5).data["column"]) == {"x"}
+    with pytest.raises(ValueError, match="expected a numeric Series"):
+        data["s"].plot(kind=kind)
+
+
+def test_quantile_sketch():
+    from altair_pandas import QuantileSketch
+    from altair_pandas._quantile import _probabilities, _quantile_table
+
+    rng = np.random.RandomState(0)
+    values = rng.lognormal(sigma=2, size=100000)
+    chunks = np.array_split(values, 7)
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    for chunk in chunks:
+        other = QuantileSketch(relative_accuracy=0.01)
+        other.update(chunk)
+        sketch.merge(other)
+    assert len(sketch) == len(values)
+
+    p = _probabilities(100, len(values))
+    exact = np.quantile(values, p)
+    assert np.all(abs(sketch.quantile(p) / exact - 1) <= 0.01)
+    assert sketch.quantile(0.9999) == pytest.approx(np.quantile(values, 0.9999), 0.01)
+
+    table = _quantile_table(pd.DataFrame({"x": values}), 100, method="sketch")
+    assert np.all(abs(table["value"] / exact - 1) <= 0.005)
+    with pytest.raises(ValueError):
+        sketch.merge(QuantileSketch())
+
+
+def test_plot_spec_cache_size(monkeypatch):
+    from altair_pandas import _spec, plot_spec
+
+    monkeypatch.setattr(_spec, "MAX_TEMPLATES", 2)
+    monkeypatch.setattr(_spec, "_templates", _spec.OrderedDict())
+    for name in ["a", "b", "a", "c"]:
+        plot_spec(pd.DataFrame({name: [1, 2]}), "line")
+    assert len(_spec._templates) == 2
+    # "b" was the least recently used.
+    assert [key[3] for key in _spec._templates] == [("a",), ("c",)]